@@ -1,30 +1,222 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_caching import Cache
+import orjson
+import atexit
+import heapq
+import logging
+import logging.handlers
+import queue
 import random
-import string
+import secrets
+import signal
+import sys
 import os
-import uuid
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from wordle_core import evaluate, labels, precompute
+
+# Request threads only enqueue log records; one listener thread writes them
+# to stderr so a slow pipe or TTY never stalls a request. Like the write
+# queue's thread, the listener is started lazily, once per process, so a
+# worker forked from a preloaded app starts its own.
+_log_q = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+_log_listener = None
+_log_pid = None
+_log_lock = threading.Lock()
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that starts this process's listener on first use"""
+
+    def enqueue(self, record):
+        global _log_listener, _log_pid
+        if _log_pid != os.getpid():
+            with _log_lock:
+                if _log_pid != os.getpid():
+                    _log_listener = logging.handlers.QueueListener(
+                        _log_q, _log_handler)
+                    _log_listener.start()
+                    _log_pid = os.getpid()
+        super().enqueue(record)
+
+
+def _stop_log_listener():
+    """Write out queued log records before exiting"""
+    if _log_listener is not None and _log_pid == os.getpid():
+        _log_listener.stop()
+
+
+logger = logging.getLogger('wordle')
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+logger.addHandler(_LazyQueueHandler(_log_q))
+# Registered first so it runs last, after the other exit hooks have logged
+atexit.register(_stop_log_listener)
 
 try:
     import firebase_admin
     from firebase_admin import credentials, firestore
+    from google.api_core.exceptions import AlreadyExists
 
     if os.path.exists('firebase-key.json'):
         cred = credentials.Certificate('firebase-key.json')
         firebase_admin.initialize_app(cred)
         db = firestore.client()
+        # Shared collection references, built once instead of per request
+        GAMES_COL = db.collection('games')
+        USERS_COL = db.collection('users')
         use_firebase = True
+
+        try:
+            # Open the gRPC channel now so the first request doesn't pay for it
+            GAMES_COL.limit(1).get()
+        except Exception as e:
+            logger.warning("Firestore warm-up query failed: %s", e)
     else:
-        print("Firebase credentials not found. Running without database.")
+        logger.warning("Firebase credentials not found. Running without database.")
         use_firebase = False
 except ImportError:
-    print("Firebase libraries not installed. Running without database.")
+    logger.warning("Firebase libraries not installed. Running without database.")
     use_firebase = False
 
+
+def _orjson_default(obj):
+    """Serialize types orjson rejects, such as Firestore's datetime subclass"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that encodes and decodes with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_orjson_default),
+            mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
+# In-process cache for Firestore reads. Set CACHE_TYPE=RedisCache (and
+# CACHE_REDIS_URL) when running several workers so they share one cache.
+cache = Cache(app, config={
+    'CACHE_TYPE': os.environ.get('CACHE_TYPE', 'SimpleCache'),
+    'CACHE_DEFAULT_TIMEOUT': 3600,
+    'CACHE_KEY_PREFIX': os.environ.get('CACHE_KEY_PREFIX', 'wordle:'),
+    'CACHE_REDIS_URL': os.environ.get('CACHE_REDIS_URL'),
+})
+
+# Firestore writes are queued and committed in batches by a background
+# thread so request handlers don't wait on a network round trip.
+WRITE_BATCH_SIZE = 100
+WRITE_BATCH_WAIT = 0.05
+
+_write_q = queue.Queue()
+_STOP_WRITER = object()
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def queue_write(doc_ref, payload, wait=False, on_commit=None):
+    """Queue a document write for the background batch writer.
+
+    With wait=True the call blocks until the batch holding the write has
+    been committed, while still keeping it ordered after earlier writes.
+    on_commit is called on the writer thread once the batch has committed
+    successfully.
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(
+                    target=_write_loop, name='firestore-writer', daemon=True)
+                _writer.start()
+    done = threading.Event() if wait else None
+    _write_q.put((doc_ref, payload, done, on_commit))
+    if done is not None:
+        done.wait(timeout=10)
+
+
+def _commit_writes(items):
+    """Commit a list of queued writes as a single Firestore batch"""
+    try:
+        batch = db.batch()
+        for doc_ref, payload, _, _ in items:
+            batch.set(doc_ref, payload, merge=True)
+        batch.commit()
+    except Exception as e:
+        logger.error("Error committing %d writes to Firestore: %s", len(items), e)
+    else:
+        for _, _, _, on_commit in items:
+            if on_commit is not None:
+                on_commit()
+    finally:
+        for _, _, done, _ in items:
+            if done is not None:
+                done.set()
+
+
+def _write_loop():
+    """Collect up to WRITE_BATCH_SIZE writes or wait WRITE_BATCH_WAIT, then commit"""
+    stopping = False
+    while not stopping:
+        items = []
+        item = _write_q.get()
+        deadline = time.monotonic() + WRITE_BATCH_WAIT
+        while True:
+            if item is _STOP_WRITER:
+                stopping = True
+                break
+            items.append(item)
+            remaining = deadline - time.monotonic()
+            # Commit straight away when a caller is waiting on this batch
+            if item[2] is not None or len(items) >= WRITE_BATCH_SIZE or remaining <= 0:
+                break
+            try:
+                item = _write_q.get(timeout=remaining)
+            except queue.Empty:
+                break
+        if items:
+            _commit_writes(items)
+
+
+def flush_writes():
+    """Commit everything still queued and stop the writer thread"""
+    if _writer is not None and _writer.is_alive():
+        _write_q.put(_STOP_WRITER)
+        _writer.join(timeout=10)
+
+
+# Turn SIGTERM into a normal exit so atexit drains the write queue. Servers
+# that install their own handler (gunicorn) are left alone.
+try:
+    if signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+except ValueError:
+    # Not imported from the main thread
+    pass
+
 WORD_LIST = [
     "WORLD", "HELLO", "GAMES", "FLASK", "REACT", "LEARN",
     "HOUSE", "CRATE", "PLATE", "SCALE", "TABLE", "SMART",
@@ -32,20 +224,189 @@ WORD_LIST = [
     "EARTH", "SPACE", "MOUNT", "QUEEN", "NIGHT", "LIGHT"
 ]
 
-active_games = {}
+# Every guess/target pair within WORD_LIST is scored once at import
+precompute(WORD_LIST)
+
+# WORD_LIST grouped by word length, so new_game doesn't filter per request
+WORDS_BY_LEN = {
+    length: tuple(word for word in WORD_LIST if len(word) == length)
+    for length in {len(word) for word in WORD_LIST}
+}
+
+# One Random per thread, so concurrent new_game calls don't share the
+# module-level generator's state
+_thread_rng = threading.local()
+
+
+def choose_word(words):
+    """Pick a random word using this thread's own Random instance"""
+    rng = getattr(_thread_rng, 'rng', None)
+    if rng is None:
+        rng = _thread_rng.rng = random.Random()
+    return rng.choice(words)
+
+
+class GameCache:
+    """In-memory games, sharded by game_id and capped as a per-shard LRU.
+
+    Each shard has its own lock, so request threads working on different
+    games rarely contend. Games evicted to make room stay in Firestore and
+    are reloaded by load_game on their next request.
+    """
+
+    def __init__(self, max_games, shards=16):
+        # shards must be a power of two so the index can be a bit mask
+        self._shards = [OrderedDict() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._mask = shards - 1
+        self._shard_size = max(1, max_games // shards)
+
+    def _index(self, game_id):
+        return hash(game_id) & self._mask
+
+    def get(self, game_id):
+        """Return the game with this id, or None, marking it recently used"""
+        index = self._index(game_id)
+        shard = self._shards[index]
+        with self._locks[index]:
+            game = shard.get(game_id)
+            if game is not None:
+                shard.move_to_end(game_id)
+        return game
+
+    def add(self, game):
+        """Store a game unless one with the same id is already stored.
+
+        Returns the stored game, so two threads loading the same game at once
+        both end up with the same object. The shard's least recently used
+        game is evicted, and saved if it has unsaved guesses, when full.
+        """
+        index = self._index(game.game_id)
+        shard = self._shards[index]
+        evicted = None
+        with self._locks[index]:
+            stored = shard.setdefault(game.game_id, game)
+            if stored is game and len(shard) > self._shard_size:
+                _, evicted = shard.popitem(last=False)
+
+        if evicted is not None and evicted.dirty:
+            evicted.save(force=True)
+        return stored
+
+    def pop(self, game_id):
+        """Remove a game and return it, or None if it wasn't stored"""
+        index = self._index(game_id)
+        with self._locks[index]:
+            return self._shards[index].pop(game_id, None)
+
+    def values(self):
+        """Snapshot all stored games, one shard at a time"""
+        games = []
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                games.extend(shard.values())
+        return games
+
+
+MAX_ACTIVE_GAMES = 10000
+active_games = GameCache(MAX_ACTIVE_GAMES)
+
+# (created_at timestamp, game_id) min-heap used to expire old games, swept
+# every CLEANUP_INTERVAL seconds by a background timer
+CLEANUP_INTERVAL = 300
+expiry_heap = []
+_expiry_lock = threading.Lock()
+_sweeper_pid = None
+_sweeper_lock = threading.Lock()
+
+# Background Firestore work (stats updates and writes) runs on EXECUTOR.
+# Game loads have their own pool so queued stats work can't delay them;
+# requests missing the same game share the in-flight read in _pending_loads.
+EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='firestore')
+LOAD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix='firestore-load')
+GAME_LOAD_TIMEOUT = 5
+STATS_UPDATE_TIMEOUT = 10
+_pending_loads = {}
+_pending_lock = threading.Lock()
+
+# Game documents are written every FLUSH_EVERY_GUESSES guesses while a game
+# is in progress, and always once it finishes.
+FLUSH_EVERY_GUESSES = 3
+
+
+def _record_game_result(transaction, stats_ref, history_ref, game):
+    """Fold a finished game into the user's stats inside a transaction.
+
+    Counters use Increment; only the streaks need the current values, so
+    only they are read. Run via firestore.transactional, which retries on
+    contention, so concurrent games can't overwrite each other's update.
+    """
+    snapshot = stats_ref.get(
+        field_paths=['current_streak', 'max_streak'], transaction=transaction)
+    current = (snapshot.to_dict() or {}) if snapshot.exists else {}
+    won = game.game_status == 'won'
+    # One timestamp for both documents written by this result
+    now_iso = datetime.now().isoformat()
+
+    current_streak = current.get('current_streak', 0) + 1 if won else 0
+    updates = {
+        'played': firestore.Increment(1),
+        'won': firestore.Increment(1 if won else 0),
+        'current_streak': current_streak,
+        'max_streak': max(current.get('max_streak', 0), current_streak),
+        'last_updated': now_iso
+    }
+    if not snapshot.exists:
+        updates['guess_distribution'] = {
+            '1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '6': 0
+        }
+
+    attempt_count = str(len(game.attempts))
+    if won and attempt_count in ('1', '2', '3', '4', '5', '6'):
+        updates.setdefault('guess_distribution', {})[attempt_count] = firestore.Increment(1)
+
+    transaction.set(stats_ref, updates, merge=True)
+
+    # Also store reference to this game in user's game history
+    transaction.set(history_ref, {
+        'game_id': game.game_id,
+        'word': game.word,
+        'attempts': len(game.attempts),
+        'status': game.game_status,
+        'played_at': now_iso
+    })
 
 
 class Game:
+    # Fixed attribute layout: no per-instance __dict__ for every active game
+    __slots__ = (
+        'game_id', 'word', 'max_attempts', 'attempts', 'evaluations',
+        'game_status', 'created_at', 'updated_at', 'dirty', 'saved_attempts',
+        'version', 'persisted', 'lock'
+    )
+
     def __init__(self, word=None, max_attempts=6):
-        self.game_id = str(uuid.uuid4())
-        self.word = word or random.choice(WORD_LIST)
+        # 12 URL-safe characters from 9 random bytes
+        self.game_id = secrets.token_urlsafe(9)
+        self.word = word or choose_word(WORD_LIST)
         self.max_attempts = max_attempts
         self.attempts = []
+        # One bytes of wordle_core codes per guess, stored as Firestore blobs
         self.evaluations = []
         self.game_status = 'playing'
         self.created_at = datetime.now()
-
-        print(f"New game created with word: {self.word}")
+        self.updated_at = datetime.now(timezone.utc)
+        self.dirty = False
+        self.saved_attempts = 0
+        # Bumped on every state change; used as the game's ETag
+        self.version = 0
+        # Whether the full document has been written to Firestore
+        self.persisted = False
+        # Serialises guesses on this game only
+        self.lock = threading.Lock()
+
+        logger.info("New game created with word: %s", self.word)
 
     def make_guess(self, guess):
         """Process a guess and return the result"""
@@ -57,6 +418,7 @@ class Game:
 
         if len(self.attempts) >= self.max_attempts:
             self.game_status = 'lost'
+            self.touch()
             return {
                 'error': 'Maximum attempts reached',
                 'game_status': self.game_status,
@@ -65,7 +427,8 @@ class Game:
 
         # Validate guess format
         guess = guess.upper()
-        if len(guess) != len(self.word) or not all(c in string.ascii_uppercase for c in guess):
+        # After upper(), an ASCII alphabetic string can only contain A-Z
+        if len(guess) != len(self.word) or not (guess.isascii() and guess.isalpha()):
             return {
                 'error': 'Invalid word format',
                 'game_status': self.game_status
@@ -75,6 +438,7 @@ class Game:
         evaluation = self.evaluate_guess(guess)
         self.attempts.append(guess)
         self.evaluations.append(evaluation)
+        self.touch()
 
         # Check if the guess is correct
         if guess == self.word:
@@ -85,42 +449,71 @@ class Game:
         # Store game in Firestore if available
         if use_firebase:
             try:
-                game_data = self.to_dict()
-                game_data['created_at'] = game_data['created_at'].isoformat()
-                db.collection('games').document(self.game_id).set(game_data)
-
-                if self.game_status != 'playing':
-                    self.update_user_stats('anonymous')
+                self.save()
             except Exception as e:
-                print(f"Error saving to Firestore: {e}")
+                logger.error("Error saving to Firestore: %s", e)
 
         return {
             'attempt_number': len(self.attempts),
-            'evaluation': evaluation,
+            'evaluation': labels(evaluation),
             'game_status': self.game_status,
             'word': self.word if self.game_status == 'lost' else None
         }
 
+    def touch(self):
+        """Record a state change for ETag and Last-Modified"""
+        self.version += 1
+        self.updated_at = datetime.now(timezone.utc)
+
     def evaluate_guess(self, guess):
         """Evaluate a guess against the target word"""
-        target = self.word
-        evaluation = ['absent'] * len(target)
-
-        for i in range(len(target)):
-            if i < len(guess) and guess[i] == target[i]:
-                evaluation[i] = 'correct'
+        return evaluate(guess, self.word)
 
-        target_char_count = {}
-        for i, char in enumerate(target):
-            if evaluation[i] != 'correct':
-                target_char_count[char] = target_char_count.get(char, 0) + 1
+    def save(self, force=False):
+        """Persist the game to Firestore, debouncing writes while it is in progress"""
+        if not use_firebase:
+            return
 
-        for i, char in enumerate(guess):
-            if evaluation[i] != 'correct' and char in target_char_count and target_char_count[char] > 0:
-                evaluation[i] = 'present'
-                target_char_count[char] -= 1
+        finished = self.game_status != 'playing'
+        pending = len(self.attempts) - self.saved_attempts
+        if not (force or finished or pending >= FLUSH_EVERY_GUESSES):
+            self.dirty = True
+            return
 
-        return evaluation
+        # The writer serialises the payload later, so queue copies. make_guess
+        # appends to attempts before evaluations; cutting both to the
+        # evaluations seen keeps a concurrent save's arrays the same length.
+        count = len(self.evaluations)
+        attempts = self.attempts[:count]
+        evaluations = self.evaluations[:count]
+
+        on_commit = None
+        if self.persisted:
+            # Merge only the fields a guess can change. The arrays go whole:
+            # ArrayUnion would drop a repeated guess or evaluation.
+            game_data = {
+                'attempts': attempts,
+                'evaluations': evaluations,
+                'game_status': self.game_status,
+                'updated_at': self.updated_at.isoformat()
+            }
+        else:
+            game_data = self.to_dict()
+            game_data['attempts'] = attempts
+            game_data['evaluations'] = evaluations
+            game_data['created_at'] = game_data['created_at'].isoformat()
+            game_data['updated_at'] = game_data['updated_at'].isoformat()
+            # Until this commits, later saves keep sending the full document
+            on_commit = self.mark_persisted
+        # Wait for the final state so a finished game is durable on return
+        queue_write(GAMES_COL.document(self.game_id),
+                    game_data, wait=finished, on_commit=on_commit)
+        self.dirty = False
+        self.saved_attempts = count
+
+    def mark_persisted(self):
+        """Record that the full game document has been committed"""
+        self.persisted = True
 
     def update_user_stats(self, user_id):
         """Update user statistics when a game is completed"""
@@ -128,61 +521,19 @@ class Game:
             return
 
         try:
-            # Get the user's current stats
-            user_ref = db.collection('users').document(user_id)
+            user_ref = USERS_COL.document(user_id)
             stats_ref = user_ref.collection('stats').document('game_stats')
-            stats_doc = stats_ref.get()
-
-            if stats_doc.exists:
-                stats = stats_doc.to_dict()
-            else:
-                stats = {
-                    'played': 0,
-                    'won': 0,
-                    'current_streak': 0,
-                    'max_streak': 0,
-                    'guess_distribution': {
-                        '1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '6': 0
-                    },
-                    'last_updated': datetime.now().isoformat()
-                }
-
-            # Update stats
-            stats['played'] += 1
-
-            if self.game_status == 'won':
-                stats['won'] += 1
-                stats['current_streak'] += 1
-
-                attempt_count = str(len(self.attempts))
-                if attempt_count in stats['guess_distribution']:
-                    stats['guess_distribution'][attempt_count] += 1
-            else:
-                stats['current_streak'] = 0
-
-            if stats['current_streak'] > stats['max_streak']:
-                stats['max_streak'] = stats['current_streak']
-
-            stats['last_updated'] = datetime.now().isoformat()
-
-            # Save updated stats
-            stats_ref.set(stats)
-
-            # Also store reference to this game in user's game history
-            game_history_ref = user_ref.collection('game_history')
-            game_history_ref.document(self.game_id).set({
-                'game_id': self.game_id,
-                'word': self.word,
-                'attempts': len(self.attempts),
-                'status': self.game_status,
-                'played_at': datetime.now().isoformat()
-            })
+            history_ref = user_ref.collection('game_history').document(self.game_id)
+
+            firestore.transactional(_record_game_result)(
+                db.transaction(), stats_ref, history_ref, self)
+            cache.delete_memoized(_load_stats, user_id)
 
-            print(f"Updated stats for user {user_id}, game status: {
-                  self.game_status}, attempts: {len(self.attempts)}")
+            logger.info("Updated stats for user %s, game status: %s, attempts: %d",
+                        user_id, self.game_status, len(self.attempts))
             return True
         except Exception as e:
-            print(f"Error updating user stats: {e}")
+            logger.error("Error updating user stats: %s", e)
             return False
 
     def to_dict(self):
@@ -194,10 +545,25 @@ class Game:
             'attempts': self.attempts,
             'evaluations': self.evaluations,
             'game_status': self.game_status,
-            'created_at': self.created_at
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
+@app.after_request
+def conditional_get(response):
+    """Answer a GET with 304 Not Modified when the client's copy is current.
+
+    Only If-None-Match is honoured. Last-Modified has whole-second
+    precision, so a change in the same second as a client's copy would
+    still match If-Modified-Since; the version ETag changes every time.
+    """
+    if (request.method == 'GET' and response.status_code == 200
+            and response.get_etag()[0] and request.if_none_match):
+        response.make_conditional(request)
+    return response
+
+
 @app.route("/")
 def home():
     return jsonify({"message": "Wordle Game API"})
@@ -210,26 +576,19 @@ def new_game():
     word_length = data.get('word_length', 5)
     max_attempts = data.get('max_attempts', 6)
 
-    filtered_words = [word for word in WORD_LIST if len(word) == word_length]
-
-    if not filtered_words:
-        word = random.choice(WORD_LIST)
-    else:
-        word = random.choice(filtered_words)
+    # Fall back to any word when no word has the requested length
+    filtered_words = WORDS_BY_LEN.get(word_length) if isinstance(word_length, int) else None
+    word = choose_word(filtered_words or WORD_LIST)
 
     game = Game(word=word, max_attempts=max_attempts)
-    active_games[game.game_id] = game
+    game = remember_game(game)
 
     # Save new game to Firebase immediately
     if use_firebase:
         try:
-            game_data = game.to_dict()
-            game_data['created_at'] = game_data['created_at'].isoformat()
-            db.collection('games').document(game.game_id).set(game_data)
+            game.save(force=True)
         except Exception as e:
-            print(f"Error saving new game to Firestore: {e}")
-
-    cleanup_old_games()
+            logger.error("Error saving new game to Firestore: %s", e)
 
     return jsonify({
         'game_id': game.game_id,
@@ -252,110 +611,264 @@ def make_guess():
     if not game_id or not guess:
         return jsonify({'error': 'Game ID and word are required'}), 400
 
-    game = active_games.get(game_id)
-
-    if not game:
-        if use_firebase:
-            try:
-                doc_ref = db.collection('games').document(game_id)
-                doc = doc_ref.get()
-                if doc.exists:
-                    game_data = doc.to_dict()
-                    game = Game(
-                        word=game_data.get('word'),
-                        max_attempts=game_data.get('max_attempts', 6)
-                    )
-                    game.game_id = game_id
-                    game.attempts = game_data.get('attempts', [])
-                    game.evaluations = game_data.get('evaluations', [])
-                    game.game_status = game_data.get('game_status', 'playing')
-                    if isinstance(game_data.get('created_at'), str):
-                        game.created_at = datetime.fromisoformat(
-                            game_data.get('created_at'))
-                    active_games[game_id] = game
-            except Exception as e:
-                print(f"Error loading game from Firestore: {e}")
+    try:
+        game = load_game(game_id)
+    except Exception:
+        return jsonify({'error': 'Game store unavailable'}), 503
 
     if not game:
         return jsonify({'error': 'Game not found'}), 404
 
-    previous_status = game.game_status
-
-    result = game.make_guess(guess)
-
+    # Two guesses racing on one game could both pass the attempt checks, or
+    # both see the game finish and count it twice in the stats. The cached
+    # GET response is dropped under the same lock get_game caches it under.
+    with game.lock:
+        previous_status = game.game_status
+        result = game.make_guess(guess)
+        cache.delete(game_cache_key(game_id))
+
+    # Stats are updated once per finished game. The frontend fetches stats
+    # as soon as the finishing guess returns, so wait for the transaction
+    # (bounded like the final game write) before answering.
     if previous_status == 'playing' and game.game_status != 'playing' and use_firebase:
+        future = EXECUTOR.submit(game.update_user_stats, 'anonymous')
         try:
-            game.update_user_stats('anonymous')
-            print(f"Explicitly updated stats after game completion. Status: {
-                  game.game_status}")
+            future.result(timeout=STATS_UPDATE_TIMEOUT)
         except Exception as e:
-            print(f"Error updating stats after status change: {e}")
+            logger.error("Stats update for game %s still pending: %r", game_id, e)
 
     return jsonify(result)
 
 
+def game_cache_key(game_id):
+    """Cache key for the GET /api/game/<game_id> response"""
+    return f'game:{game_id}'
+
+
 @app.route('/api/game/<game_id>', methods=['GET'])
 def get_game(game_id):
     """Get game information"""
-    game = active_games.get(game_id)
+    key = game_cache_key(game_id)
+    cached = cache.get(key)
 
-    if not game and use_firebase:
+    if cached is None:
         try:
-            doc_ref = db.collection('games').document(game_id)
-            doc = doc_ref.get()
-            if doc.exists:
-                game_data = doc.to_dict()
-                # Create a Game instance for future use
-                game = Game(
-                    word=game_data.get('word'),
-                    max_attempts=game_data.get('max_attempts', 6)
-                )
-                game.game_id = game_id
-                game.attempts = game_data.get('attempts', [])
-                game.evaluations = game_data.get('evaluations', [])
-                game.game_status = game_data.get('game_status', 'playing')
-                if isinstance(game_data.get('created_at'), str):
-                    game.created_at = datetime.fromisoformat(
-                        game_data.get('created_at'))
-                active_games[game_id] = game
-
-                return jsonify({
-                    'game_id': game_id,
-                    'attempts': game_data.get('attempts', []),
-                    'evaluations': game_data.get('evaluations', []),
-                    'game_status': game_data.get('game_status', 'playing'),
-                    'max_attempts': game_data.get('max_attempts', 6),
-                    'word_length': len(game_data.get('word', '')),
-                    'word': game_data.get('word') if game_data.get('game_status') != 'playing' else None
-                })
-        except Exception as e:
-            print(f"Error loading game from Firestore: {e}")
-
-    if not game:
-        return jsonify({'error': 'Game not found'}), 404
-
-    return jsonify({
-        'game_id': game.game_id,
-        'attempts': game.attempts,
-        'evaluations': game.evaluations,
-        'game_status': game.game_status,
-        'max_attempts': game.max_attempts,
-        'word_length': len(game.word),
-        'word': game.word if game.game_status != 'playing' else None
-    })
+            game = load_game(game_id)
+        except Exception:
+            return jsonify({'error': 'Game store unavailable'}), 503
+
+        if not game:
+            return jsonify({'error': 'Game not found'}), 404
+
+        # Rendered and cached under the game's lock: a guess can't slip in
+        # between, so its cache.delete always follows any older cached copy
+        with game.lock:
+            cached = {
+                'game': {
+                    'game_id': game.game_id,
+                    'attempts': list(game.attempts),
+                    'evaluations': [labels(ev) for ev in game.evaluations],
+                    'game_status': game.game_status,
+                    'max_attempts': game.max_attempts,
+                    'word_length': len(game.word),
+                    'word': game.word if game.game_status != 'playing' else None
+                },
+                'etag': f'{game.game_id}:{game.version}',
+                'last_modified': game.updated_at
+            }
+            cache.set(key, cached, timeout=30)
+
+    response = jsonify(cached['game'])
+    response.set_etag(cached['etag'])
+    response.last_modified = cached['last_modified']
+    # The frontend refetches right after each guess, so the browser must
+    # revalidate every time; unchanged polls still get a 304 via the ETag
+    response.cache_control.no_cache = True
+    return response
+
+
+def _load_game(game_id):
+    """Read a game from Firestore and keep it in memory, or return None"""
+    doc = GAMES_COL.document(game_id).get()
+    if not doc.exists:
+        return None
+
+    game_data = doc.to_dict()
+    if not game_data.get('word'):
+        # Only delta writes landed; without its word the game can't be scored
+        logger.warning("Game %s in Firestore has no word, ignoring it", game_id)
+        return None
+
+    game = Game(
+        word=game_data.get('word'),
+        max_attempts=game_data.get('max_attempts', 6)
+    )
+    game.game_id = game_id
+    game.attempts = game_data.get('attempts', [])
+    game.evaluations = game_data.get('evaluations', [])
+    game.saved_attempts = len(game.attempts)
+    game.persisted = True
+    game.version = len(game.attempts)
+    game.game_status = game_data.get('game_status', 'playing')
+    if isinstance(game_data.get('created_at'), str):
+        game.created_at = datetime.fromisoformat(game_data.get('created_at'))
+    if isinstance(game_data.get('updated_at'), str):
+        game.updated_at = datetime.fromisoformat(game_data.get('updated_at'))
+    return remember_game(game)
+
+
+def load_game(game_id):
+    """Return a game from memory, loading it from Firestore on a miss.
+
+    Concurrent misses for the same game wait on one shared Firestore read.
+    Returns None if the game doesn't exist; a failed or timed out read is
+    logged and re-raised, so it isn't reported as a missing game.
+    """
+    game = active_games.get(game_id)
+    if game or not use_firebase:
+        return game
+
+    with _pending_lock:
+        future = _pending_loads.get(game_id)
+        if future is None:
+            future = LOAD_EXECUTOR.submit(_load_game, game_id)
+            _pending_loads[game_id] = future
+
+    try:
+        return future.result(timeout=GAME_LOAD_TIMEOUT)
+    except Exception as e:
+        # %r: a timeout's TimeoutError has an empty message
+        logger.error("Error loading game %s from Firestore: %r", game_id, e)
+        raise
+    finally:
+        with _pending_lock:
+            if _pending_loads.get(game_id) is future:
+                del _pending_loads[game_id]
+
+
+def remember_game(game):
+    """Keep a game in memory, schedule its expiry and return the stored game"""
+    _start_sweeper()
+    stored = active_games.add(game)
+    if stored is game:
+        with _expiry_lock:
+            heapq.heappush(expiry_heap, (game.created_at.timestamp(), game.game_id))
+            # Evicted and reloaded games leave stale entries behind; keep the
+            # heap proportional to the games actually stored
+            if len(expiry_heap) > 2 * MAX_ACTIVE_GAMES:
+                _rebuild_expiry_heap()
+    return stored
+
+
+def _rebuild_expiry_heap():
+    """Rebuild expiry_heap from the stored games; caller holds _expiry_lock"""
+    expiry_heap[:] = {
+        (game.created_at.timestamp(), game.game_id)
+        for game in active_games.values()
+    }
+    heapq.heapify(expiry_heap)
 
 
 def cleanup_old_games():
     """Remove games older than 24 hours from memory"""
-    now = datetime.now()
+    cutoff = (datetime.now() - timedelta(hours=24)).timestamp()
     expired_games = []
 
-    for game_id, game in active_games.items():
-        if now - game.created_at > timedelta(hours=24):
+    with _expiry_lock:
+        while expiry_heap and expiry_heap[0][0] < cutoff:
+            _, game_id = heapq.heappop(expiry_heap)
             expired_games.append(game_id)
 
     for game_id in expired_games:
-        del active_games[game_id]
+        game = active_games.pop(game_id)
+        if game is not None and game.dirty:
+            game.save(force=True)
+
+
+def _sweep_old_games():
+    """Run cleanup_old_games, then schedule the next sweep"""
+    try:
+        cleanup_old_games()
+    except Exception as e:
+        logger.error("Error cleaning up old games: %s", e)
+    _schedule_sweep()
+
+
+def _schedule_sweep():
+    """Run _sweep_old_games after CLEANUP_INTERVAL seconds"""
+    timer = threading.Timer(CLEANUP_INTERVAL, _sweep_old_games)
+    timer.daemon = True
+    timer.start()
+
+
+def _start_sweeper():
+    """Start this process's sweep timer on first use, like the writer thread"""
+    global _sweeper_pid
+    if _sweeper_pid != os.getpid():
+        with _sweeper_lock:
+            if _sweeper_pid != os.getpid():
+                _schedule_sweep()
+                _sweeper_pid = os.getpid()
+
+
+def flush_games():
+    """Write unsaved games and drain the write queue before exiting"""
+    if use_firebase:
+        for game in active_games.values():
+            if game.dirty:
+                game.save(force=True)
+    flush_writes()
+
+
+atexit.register(flush_games)
+
+
+# Fields returned by GET /api/stats; anything else on the document stays
+# on the server
+STATS_FIELDS = [
+    'played', 'won', 'current_streak', 'max_streak',
+    'guess_distribution', 'last_updated'
+]
+
+
+def _log_default_stats_error(future):
+    """Log a failed default stats write; an existing document is fine"""
+    error = future.exception()
+    if error is not None and not isinstance(error, AlreadyExists):
+        logger.error("Error creating default stats: %s", error)
+
+
+@cache.memoize(timeout=60)
+def _load_stats(user_id):
+    """Read a user's stats from Firestore, creating the document if missing"""
+    user_ref = USERS_COL.document(user_id)
+    stats_doc = user_ref.collection('stats').document('game_stats').get(
+        field_paths=STATS_FIELDS)
+
+    if stats_doc.exists:
+        stats = stats_doc.to_dict()
+        logger.info("Retrieved stats for user %s: %s", user_id, stats)
+        return stats
+
+    default_stats = {
+        'played': 0,
+        'won': 0,
+        'current_streak': 0,
+        'max_streak': 0,
+        'guess_distribution': {
+            '1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '6': 0
+        },
+        'last_updated': datetime.now().isoformat()
+    }
+    # Initialize stats document so it exists next time, without making the
+    # response wait for the write. create() fails rather than overwrite a
+    # document a finished game's transaction has written in the meantime.
+    future = EXECUTOR.submit(
+        user_ref.collection('stats').document('game_stats').create,
+        default_stats)
+    future.add_done_callback(_log_default_stats_error)
+    logger.info("Created default stats for user %s", user_id)
+    return default_stats
 
 
 @app.route('/api/stats', methods=['GET'])
@@ -364,39 +877,14 @@ def get_stats():
     if use_firebase:
         try:
             user_id = request.args.get('user_id', 'anonymous')
-
-            user_ref = db.collection('users').document(user_id)
-            stats_doc = user_ref.collection(
-                'stats').document('game_stats').get()
-
-            if stats_doc.exists:
-                stats = stats_doc.to_dict()
-                print(f"Retrieved stats for user {user_id}: {stats}")
-                return jsonify({
-                    'success': True,
-                    'stats': stats
-                })
-            else:
-                default_stats = {
-                    'played': 0,
-                    'won': 0,
-                    'current_streak': 0,
-                    'max_streak': 0,
-                    'guess_distribution': {
-                        '1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '6': 0
-                    },
-                    'last_updated': datetime.now().isoformat()
-                }
-                # Initialize stats document so it exists next time
-                user_ref.collection('stats').document(
-                    'game_stats').set(default_stats)
-                print(f"Created default stats for user {user_id}")
-                return jsonify({
-                    'success': True,
-                    'stats': default_stats
-                })
+            response = jsonify({
+                'success': True,
+                'stats': _load_stats(user_id)
+            })
+            response.add_etag()
+            return response
         except Exception as e:
-            print(f"Error fetching stats: {e}")
+            logger.error("Error fetching stats: %s", e)
 
     # Return mock stats if Firebase is not configured or there was an error
     return jsonify({
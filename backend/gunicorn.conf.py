@@ -0,0 +1,16 @@
+"""Gunicorn settings for serving the API with gevent workers.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Handlers spend most of their time waiting on Firestore, so one gevent
+worker serves many requests concurrently. Games live in process memory and
+their Firestore copy can trail by a few guesses, so only raise
+GUNICORN_WORKERS behind a load balancer that keeps a game on one worker,
+and with CACHE_TYPE=RedisCache so cache invalidation reaches every worker.
+"""
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+worker_class = 'gevent'
+workers = int(os.environ.get('GUNICORN_WORKERS', 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
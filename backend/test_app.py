@@ -0,0 +1,203 @@
+"""Regression tests for the game API's caching, persistence and load paths"""
+import copy
+import threading
+import time
+
+import pytest
+
+import app
+
+
+class FakeSnapshot:
+    def __init__(self, data):
+        self.exists = data is not None
+        self._data = copy.deepcopy(data)
+
+    def to_dict(self):
+        return self._data
+
+
+class FakeDocument:
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+
+    def get(self, field_paths=None, transaction=None):
+        return FakeSnapshot(self.db.docs.get(self.path))
+
+
+class FakeCollection:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def document(self, doc_id):
+        return FakeDocument(self.db, f'{self.name}/{doc_id}')
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def set(self, doc_ref, payload, merge=False):
+        # Serialised here, at commit time, like the real client
+        self.writes.append((doc_ref.path, copy.deepcopy(payload)))
+
+    def commit(self):
+        if self.db.fail_commits:
+            self.db.fail_commits -= 1
+            raise RuntimeError('commit failed')
+        for path, payload in self.writes:
+            self.db.docs.setdefault(path, {}).update(payload)
+
+
+class FakeFirestore:
+    """In-memory stand-in for the parts of Firestore the write path uses"""
+
+    def __init__(self):
+        self.docs = {}
+        self.fail_commits = 0
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+@pytest.fixture
+def client():
+    app.cache.clear()
+    return app.app.test_client()
+
+
+@pytest.fixture
+def firestore(monkeypatch):
+    db = FakeFirestore()
+    monkeypatch.setattr(app, 'use_firebase', True)
+    monkeypatch.setattr(app, 'db', db, raising=False)
+    monkeypatch.setattr(app, 'GAMES_COL', db.collection('games'), raising=False)
+    return db
+
+
+def wait_for_writes(db):
+    """Block until every write queued so far has been committed"""
+    app.queue_write(db.collection('test').document('barrier'), {}, wait=True)
+
+
+def new_game(client):
+    return client.post('/api/new-game', json={}).get_json()['game_id']
+
+
+def test_guess_in_same_second_is_not_hidden_by_if_modified_since(client):
+    game_id = new_game(client)
+    first = client.get(f'/api/game/{game_id}')
+    client.post('/api/guess', json={'game_id': game_id, 'word': 'ABCDE'})
+
+    response = client.get(f'/api/game/{game_id}', headers={
+        'If-Modified-Since': first.headers['Last-Modified']})
+
+    assert response.status_code == 200
+    assert response.get_json()['attempts'] == ['ABCDE']
+    assert response.headers['Cache-Control'] == 'no-cache'
+    assert response.last_modified <= app.datetime.now(app.timezone.utc)
+
+
+def test_etag_revalidation(client):
+    game_id = new_game(client)
+    first = client.get(f'/api/game/{game_id}')
+
+    unchanged = client.get(f'/api/game/{game_id}', headers={
+        'If-None-Match': first.headers['ETag']})
+    assert unchanged.status_code == 304
+
+    client.post('/api/guess', json={'game_id': game_id, 'word': 'ABCDE'})
+    changed = client.get(f'/api/game/{game_id}', headers={
+        'If-None-Match': first.headers['ETag']})
+    assert changed.status_code == 200
+    assert changed.get_json()['attempts'] == ['ABCDE']
+
+
+def test_game_is_persisted_only_after_full_write_commits(client, firestore):
+    firestore.fail_commits = 1
+    game_id = new_game(client)
+    wait_for_writes(firestore)
+
+    game = app.active_games.get(game_id)
+    assert not game.persisted
+    assert f'games/{game_id}' not in firestore.docs
+
+    # The next flush must resend the whole document, word included
+    for _ in range(app.FLUSH_EVERY_GUESSES):
+        client.post('/api/guess', json={'game_id': game_id, 'word': 'ABCDE'})
+    wait_for_writes(firestore)
+
+    stored = firestore.docs[f'games/{game_id}']
+    assert game.persisted
+    assert stored['word'] == game.word
+    assert len(stored['attempts']) == len(stored['evaluations']) == 3
+
+
+def test_stored_game_without_word_is_not_found(client, firestore):
+    firestore.docs['games/partial'] = {'attempts': ['ABCDE']}
+
+    assert client.get('/api/game/partial').status_code == 404
+
+
+def test_failed_load_is_unavailable_not_missing(client, firestore, monkeypatch):
+    def broken_load(game_id):
+        raise RuntimeError('Firestore unavailable')
+
+    monkeypatch.setattr(app, '_load_game', broken_load)
+
+    assert client.get('/api/game/some-game').status_code == 503
+    response = client.post(
+        '/api/guess', json={'game_id': 'some-game', 'word': 'ABCDE'})
+    assert response.status_code == 503
+
+
+def test_timed_out_load_is_unavailable_not_missing(client, firestore, monkeypatch):
+    def slow_load(game_id):
+        time.sleep(0.5)
+
+    monkeypatch.setattr(app, '_load_game', slow_load)
+    monkeypatch.setattr(app, 'GAME_LOAD_TIMEOUT', 0.05)
+
+    assert client.get('/api/game/slow-game').status_code == 503
+
+
+def test_guess_cannot_be_hidden_by_a_racing_cache_fill(client, monkeypatch):
+    game_id = new_game(client)
+    key = app.game_cache_key(game_id)
+    setting = threading.Event()
+    release = threading.Event()
+    original_set = app.cache.set
+
+    def slow_set(cache_key, value, *args, **kwargs):
+        # Hold the GET between rendering the game and caching it
+        if cache_key == key and not release.is_set():
+            setting.set()
+            release.wait(timeout=5)
+        return original_set(cache_key, value, *args, **kwargs)
+
+    monkeypatch.setattr(app.cache, 'set', slow_set)
+
+    reader = threading.Thread(
+        target=lambda: app.app.test_client().get(f'/api/game/{game_id}'))
+    guesser = threading.Thread(target=lambda: app.app.test_client().post(
+        '/api/guess', json={'game_id': game_id, 'word': 'ABCDE'}))
+    reader.start()
+    assert setting.wait(timeout=5)
+    guesser.start()
+
+    # The guess waits for the GET to finish caching the old state...
+    guesser.join(timeout=0.2)
+    assert guesser.is_alive()
+
+    # ...so its invalidation lands after the stale copy, not before it
+    release.set()
+    reader.join(timeout=5)
+    guesser.join(timeout=5)
+
+    assert client.get(f'/api/game/{game_id}').get_json()['attempts'] == ['ABCDE']
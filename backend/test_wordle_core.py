@@ -0,0 +1,56 @@
+"""Tests for the generated scoring kernels in wordle_core"""
+import random
+
+import pytest
+
+import wordle_core
+from wordle_core import ABSENT, CORRECT, PRESENT, evaluate, labels, precompute
+
+
+def reference_evaluate(guess, target):
+    """Straightforward two-pass scoring used as the oracle"""
+    evaluation = [ABSENT] * len(target)
+    remaining = {}
+    for i, (g, t) in enumerate(zip(guess, target)):
+        if g == t:
+            evaluation[i] = CORRECT
+        else:
+            remaining[t] = remaining.get(t, 0) + 1
+
+    for i, (g, t) in enumerate(zip(guess, target)):
+        if g != t and remaining.get(g):
+            evaluation[i] = PRESENT
+            remaining[g] -= 1
+
+    return bytes(evaluation)
+
+
+@pytest.mark.parametrize('length', range(1, 9))
+def test_kernel_matches_reference(length):
+    rng = random.Random(length)
+    # A small alphabet forces repeated letters, the case the counts handle
+    alphabet = 'ABCDEEZ'
+    for _ in range(5000):
+        guess = ''.join(rng.choice(alphabet) for _ in range(length))
+        target = ''.join(rng.choice(alphabet) for _ in range(length))
+        assert wordle_core._evaluate.__wrapped__(guess, target) == \
+            reference_evaluate(guess, target), (guess, target)
+
+
+def test_known_evaluations():
+    assert labels(evaluate('SPEED', 'ERASE')) == [
+        'present', 'absent', 'present', 'present', 'absent']
+    assert labels(evaluate('PAPER', 'PAPER')) == ['correct'] * 5
+
+
+def test_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        evaluate('HELLO', 'PLANET')
+
+
+def test_precompute_mixed_lengths(monkeypatch):
+    # Fill a throwaway table so other tests see the module's own
+    monkeypatch.setattr(wordle_core, '_TABLE', {})
+    precompute(['HELLO', 'PLANET', 'WORLD'])
+    assert evaluate('PLANET', 'PLANET') == bytes([CORRECT] * 6)
+    assert ('HELLO', 'PLANET') not in wordle_core._TABLE
@@ -0,0 +1,100 @@
+"""Wordle guess scoring, kept free of Flask and Firestore"""
+import functools
+
+# Per-letter evaluation codes, indexed by the byte stored for each letter
+ABSENT, PRESENT, CORRECT = 0, 1, 2
+CODES = ('absent', 'present', 'correct')
+
+# Evaluations precomputed for known word pairs, keyed by (guess, target)
+_TABLE = {}
+
+
+def evaluate(guess, target):
+    """Score a guess as bytes, one ABSENT, PRESENT or CORRECT code per letter.
+
+    Raises ValueError when guess and target differ in length.
+    """
+    evaluation = _TABLE.get((guess, target))
+    if evaluation is None:
+        evaluation = _evaluate(guess, target)
+    return evaluation
+
+
+def labels(evaluation):
+    """Map an evaluation's codes to their 'absent'/'present'/'correct' labels"""
+    return [CODES[code] for code in evaluation]
+
+
+def precompute(words):
+    """Fill the lookup table for every same-length guess/target pair in words"""
+    words_by_len = {}
+    for word in words:
+        words_by_len.setdefault(len(word), []).append(word)
+
+    # Share one object per distinct evaluation; there are at most 3**5 for
+    # five-letter words, however many pairs map to them
+    interned = {}
+    for same_len in words_by_len.values():
+        for target in same_len:
+            for guess in same_len:
+                # Bypass the memo so table pairs don't also fill the LRU cache
+                evaluation = _evaluate.__wrapped__(guess, target)
+                _TABLE[guess, target] = interned.setdefault(
+                    evaluation, evaluation)
+
+
+@functools.lru_cache(maxsize=4096)
+def _evaluate(guess, target):
+    """Score a guess from scratch, memoized per (guess, target) pair"""
+    # Iterating bytes yields letter codes directly; 'A' is 65
+    guess_b = guess.encode('ascii')
+    target_b = target.encode('ascii')
+    length = len(target_b)
+    if len(guess_b) != length:
+        raise ValueError(
+            f"Guess has {len(guess_b)} letters, target has {length}")
+    kernel = _KERNELS.get(length)
+    if kernel is None:
+        kernel = _KERNELS.setdefault(length, _build_kernel(length))
+    return kernel(guess_b, target_b)
+
+
+# Generated scoring functions, one per word length
+_KERNELS = {}
+
+
+def _build_kernel(length):
+    """Compile a scoring function fully unrolled for words of this length.
+
+    The generated code unpacks both words' letter codes into locals and
+    scores them in straight-line code: no loops, len() or index bounds.
+    """
+    positions = range(length)
+    lines = [
+        'def kernel(guess_b, target_b):',
+        '    ' + ''.join(f'g{i}, ' for i in positions) + '= guess_b',
+        '    ' + ''.join(f't{i}, ' for i in positions) + '= target_b',
+        '    ' + ''.join(f'e{i} = ' for i in positions) + 'ABSENT',
+        # Target letters not matched in place, counted per A-Z slot
+        '    letter_counts = [0] * 26',
+    ]
+    for i in positions:
+        lines += [
+            f'    if g{i} == t{i}:',
+            f'        e{i} = CORRECT',
+            '    else:',
+            f'        letter_counts[t{i} - 65] += 1',
+        ]
+    for i in positions:
+        lines += [
+            f'    if not e{i} and letter_counts[g{i} - 65]:',
+            f'        e{i} = PRESENT',
+            f'        letter_counts[g{i} - 65] -= 1',
+        ]
+    codes = ''.join(f'e{i}, ' for i in positions)
+    lines.append(f'    return bytes(({codes}))')
+
+    namespace = {'ABSENT': ABSENT, 'PRESENT': PRESENT, 'CORRECT': CORRECT}
+    code = compile('\n'.join(lines), f'<wordle kernel {length}>', 'exec')
+    exec(code, namespace)
+    return namespace['kernel']
@@ -0,0 +1,28 @@
+"""WSGI entry point for running the API under a production server.
+
+    waitress-serve --threads=16 --port=5000 wsgi:app
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+or simply ``python wsgi.py``. ``python app.py`` remains the Flask dev server.
+"""
+import os
+
+try:
+    from gevent import monkey
+
+    # gunicorn's gevent worker has already monkey-patched the standard
+    # library; gRPC (used by Firestore) needs its own hook to cooperate
+    if monkey.is_module_patched('socket'):
+        import grpc.experimental.gevent
+        grpc.experimental.gevent.init_gevent()
+except ImportError:
+    pass
+
+from app import app
+
+if __name__ == '__main__':
+    from waitress import serve
+
+    serve(app, host=os.environ.get('HOST', '0.0.0.0'),
+          port=int(os.environ.get('PORT', 5000)),
+          threads=int(os.environ.get('WAITRESS_THREADS', 16)))